@@ -14,6 +14,11 @@ class SGPPMConfig(IConfig):
         fit_points (int): the number of points used for fitting
         search_rel_height (float): the relative height used for searching
         pick_rel_height (float): the relative height used for picking
+        max_workers (int): the number of worker processes for batches; the default of 1
+            processes in-process, None uses all cores (scripts then need a __main__ guard
+            on platforms that spawn worker processes)
+        chunksize (int): the number of chromatograms sent to a worker at a time; batches
+            no larger than this are processed in-process
     """
     correction_method = "SWM"
     window_length = 5
@@ -29,3 +34,5 @@ class SGPPMConfig(IConfig):
     symmetry_threshold = 0.25
     noise_factor = 3.0
     peak_time_threshold = 0.5
+    max_workers = 1
+    chunksize = 4
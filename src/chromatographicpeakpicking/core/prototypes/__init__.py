@@ -6,6 +6,7 @@ from .building_block import BuildingBlock
 from .chromatogram import Chromatogram
 from .hierarchy import Hierarchy
 from .peak import Peak
+from .peak_batch import PeakBatch, PeakView, peak_column
 from .peptide import Peptide
 
 __all__ = [
@@ -13,5 +14,8 @@ __all__ = [
     'Chromatogram',
     'Hierarchy',
     'Peak',
-    'Peptide'
+    'PeakBatch',
+    'PeakView',
+    'Peptide',
+    'peak_column'
 ]
@@ -22,7 +22,7 @@ from typing import Dict, Any, Optional
 from uuid import uuid4
 import copy
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BuildingBlock:
     """
     Represents a peptide building block.
@@ -36,6 +36,7 @@ class BuildingBlock:
         smiles (str): The SMILES string of the building block.
         properties (Dict[str, Any]): Additional properties of the building block.
         metadata (Dict[str, Any]): Metadata associated with the building block.
+        is_null (bool): Whether this is the null building block, derived from the name.
     """
 
     name: str = field(default="")
@@ -43,6 +44,7 @@ class BuildingBlock:
     smiles: str = field(default="")
     properties: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    is_null: bool = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """
@@ -56,6 +58,8 @@ class BuildingBlock:
             raise ValueError("Building block name cannot be empty")
         if self.id == "":
             raise ValueError("Building block ID cannot be empty")
+        # Names never change, so the null check is made once here rather than on every use
+        object.__setattr__(self, 'is_null', self.name == "Null")
 
     def clone(self, **kwargs: Any) -> 'BuildingBlock':
         """
@@ -73,4 +77,5 @@ class BuildingBlock:
         object.__setattr__(new_instance, 'id', new_instance_id)
         for key, value in kwargs.items():
             object.__setattr__(new_instance, key, value)
+        object.__setattr__(new_instance, 'is_null', new_instance.name == "Null")
         return new_instance
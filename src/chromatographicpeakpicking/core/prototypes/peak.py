@@ -22,7 +22,7 @@ from typing import Dict, Any
 from uuid import uuid4
 import copy
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Peak:
     """
     Represents a chromatographic peak with its basic attributes.
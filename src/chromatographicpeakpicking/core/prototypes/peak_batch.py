@@ -0,0 +1,231 @@
+# src/chromatographicpeakpicking/core/prototypes/peak_batch.py
+"""
+Module: peak_batch
+
+This module defines the PeakBatch class, which stores the peaks detected in a chromatogram as
+parallel NumPy columns (struct-of-arrays) rather than one dictionary per peak, and the PeakView
+class, which exposes a single row of a batch through the familiar ``peak['time']`` interface.
+
+Rationale:
+    - Efficiency: Each peak costs a handful of contiguous floats instead of a full dictionary,
+        and column-wise operations (thresholding, arg-max selection) run as vectorized NumPy.
+    - Compatibility: Code written against dictionary-style peaks keeps working through PeakView,
+        including storing additional per-peak results that have no dedicated column.
+"""
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+
+@dataclass
+class PeakBatch:
+    """
+    Column-oriented storage for the peaks of a chromatogram.
+
+    Attributes:
+        time (np.ndarray): Apex times of the peaks.
+        index (np.ndarray): Apex indices of the peaks.
+        height (np.ndarray): Apex heights of the peaks.
+        prominence (np.ndarray): Prominences of the peaks.
+        width (np.ndarray): Widths of the peaks in samples.
+        width_5 (np.ndarray): Heights at which the widths were evaluated.
+        left_base_index (np.ndarray): Indices of the left peak bases.
+        right_base_index (np.ndarray): Indices of the right peak bases.
+        left_base_time (np.ndarray): Times of the left peak bases.
+        right_base_time (np.ndarray): Times of the right peak bases.
+    """
+
+    COLUMNS: ClassVar[Tuple[str, ...]] = (
+        'time', 'index', 'height', 'prominence', 'width', 'width_5',
+        'left_base_index', 'right_base_index', 'left_base_time', 'right_base_time'
+    )
+
+    time: np.ndarray
+    index: np.ndarray
+    height: np.ndarray
+    prominence: np.ndarray
+    width: np.ndarray
+    width_5: np.ndarray
+    left_base_index: np.ndarray
+    right_base_index: np.ndarray
+    left_base_time: np.ndarray
+    right_base_time: np.ndarray
+    _columns: Dict[str, np.ndarray] = field(init=False, repr=False)
+    _extras: Dict[int, Dict[str, Any]] = field(init=False, repr=False)
+    _views: List[Optional['PeakView']] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """
+        Validate column lengths after initialization.
+
+        Raises:
+            ValueError: If the columns do not all have the same length.
+        """
+        size = len(self.time)
+        if any(len(getattr(self, name)) != size for name in self.COLUMNS):
+            raise ValueError("All peak columns must have the same length")
+        # Columns are looked up by name on every PeakView read, so keep them in a dict
+        self._columns = {name: getattr(self, name) for name in self.COLUMNS}
+        # Extra per-peak results are only allocated for rows that receive one
+        self._extras = {}
+        self._views = [None] * size
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Keep the column lookup in step when a column array is replaced."""
+        super().__setattr__(name, value)
+        columns = self.__dict__.get('_columns')
+        if columns is not None and name in columns:
+            columns[name] = value
+
+    @classmethod
+    def from_find_peaks(
+        cls,
+        x: np.ndarray,
+        indices: np.ndarray,
+        properties: Dict[str, np.ndarray]
+    ) -> 'PeakBatch':
+        """
+        Build a batch directly from ``scipy.signal.find_peaks`` output.
+
+        Args:
+            x (np.ndarray): Time values of the chromatogram.
+            indices (np.ndarray): Peak indices returned by find_peaks.
+            properties (Dict[str, np.ndarray]): Peak properties returned by find_peaks.
+
+        Returns:
+            PeakBatch: A batch holding one row per detected peak.
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        left_bases = np.asarray(properties['left_bases'], dtype=np.intp)
+        right_bases = np.asarray(properties['right_bases'], dtype=np.intp)
+        return cls(
+            time=np.asarray(x[indices], dtype=np.float64),
+            index=indices,
+            height=np.asarray(properties['peak_heights'], dtype=np.float64),
+            prominence=np.asarray(properties['prominences'], dtype=np.float64),
+            width=np.asarray(properties['widths'], dtype=np.float64),
+            width_5=np.asarray(properties['width_heights'], dtype=np.float64),
+            left_base_index=left_bases,
+            right_base_index=right_bases,
+            left_base_time=np.asarray(x[left_bases], dtype=np.float64),
+            right_base_time=np.asarray(x[right_bases], dtype=np.float64)
+        )
+
+    @classmethod
+    def concatenate(cls, batches: Sequence['PeakBatch']) -> 'PeakBatch':
+        """
+        Join batches into one, keeping the peaks of each batch in order.
+
+        Extra per-peak results are carried over. Views of the input batches are not, so
+        peaks read from the result are new PeakView objects.
+
+        Args:
+            batches (Sequence[PeakBatch]): The batches to join.
+
+        Returns:
+            PeakBatch: A batch holding the rows of every input batch.
+        """
+        batch = cls(**{
+            name: np.concatenate([getattr(part, name) for part in batches])
+            for name in cls.COLUMNS
+        })
+        offset = 0
+        for part in batches:
+            for row, extras in part._extras.items():
+                batch._extras[offset + row] = dict(extras)
+            offset += len(part)
+        return batch
+
+    def __len__(self) -> int:
+        """Get the number of peaks."""
+        return len(self.time)
+
+    def __getitem__(self, row: int) -> 'PeakView':
+        """
+        Get a dictionary-style view of a single peak.
+
+        The same view object is returned for repeated lookups of a row, so identity
+        comparisons such as ``peak is chrom.picked_peak`` keep working.
+        """
+        view = self._views[row]
+        if view is None:
+            view = PeakView(self, range(len(self))[row])
+            self._views[row] = view
+        return view
+
+    def __iter__(self) -> Iterator['PeakView']:
+        """Iterate over dictionary-style views of the peaks."""
+        return (self[row] for row in range(len(self)))
+
+
+class PeakView(MutableMapping):
+    """
+    Dictionary-style access to one row of a PeakBatch.
+
+    Keys matching a batch column read and write that column; any other key is stored
+    alongside the row.
+    """
+
+    __slots__ = ('_batch', '_row')
+
+    def __init__(self, batch: PeakBatch, row: int):
+        self._batch = batch
+        self._row = row
+
+    def __getitem__(self, key: str) -> Any:
+        column = self._batch._columns.get(key)
+        if column is not None:
+            return column.item(self._row)
+        extras = self._batch._extras.get(self._row)
+        if extras is None:
+            raise KeyError(key)
+        return extras[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        column = self._batch._columns.get(key)
+        if column is not None:
+            column[self._row] = value
+        else:
+            self._batch._extras.setdefault(self._row, {})[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._batch._columns:
+            raise KeyError(f"Cannot delete peak column: {key}")
+        extras = self._batch._extras.get(self._row)
+        if extras is None:
+            raise KeyError(key)
+        del extras[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from PeakBatch.COLUMNS
+        yield from self._batch._extras.get(self._row, ())
+
+    def __len__(self) -> int:
+        return len(PeakBatch.COLUMNS) + len(self._batch._extras.get(self._row, ()))
+
+    def __repr__(self) -> str:
+        return f"PeakView({dict(self)})"
+
+
+def peak_column(
+    peaks: Any,
+    name: str,
+    dtype: Any = np.float64
+) -> np.ndarray:
+    """
+    Get one value of every peak as an array.
+
+    A PeakBatch already stores the value as a column, which is returned directly
+    without copying; any other sequence of dictionary-style peaks is gathered once.
+
+    Args:
+        peaks (Any): A PeakBatch or a sequence of dictionary-style peaks.
+        name (str): The peak value to gather, e.g. ``'height'``.
+        dtype (Any): The dtype used when the values have to be gathered.
+
+    Returns:
+        np.ndarray: The values in peak order.
+    """
+    if isinstance(peaks, PeakBatch):
+        return peaks._columns[name]
+    return np.fromiter((peak[name] for peak in peaks), dtype=dtype, count=len(peaks))
@@ -24,7 +24,7 @@ import copy
 from .building_block import BuildingBlock
 from .chromatogram import Chromatogram
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Peptide:
     """
     Represents a peptide sequence with its associated building blocks and chromatograms.
@@ -92,6 +92,7 @@ class ChromatogramAnalyzer(Configurable[ChromatogramAnalyzerConfig]):
         self._validate_chromatogram(chrom)
 
         try:
+            self._calculate_range_metrics(chrom)
             self._calculate_noise_metrics(chrom)
             self._calculate_baseline_metrics(chrom)
             self._calculate_area_metrics(chrom)
@@ -193,6 +194,14 @@ class ChromatogramAnalyzer(Configurable[ChromatogramAnalyzerConfig]):
 
         return merged_regions
 
+    def _calculate_range_metrics(self, chrom: Chromatogram) -> None:
+        if self.global_config.debug:
+            self.logger.debug("Calculating intensity range")
+
+        # Cached so later stages don't rescan the signal for its extremes
+        chrom.metadata['y_min'] = float(np.min(chrom.intensity))
+        chrom.metadata['y_max'] = float(np.max(chrom.intensity))
+
     def _calculate_noise_metrics(self, chrom: Chromatogram) -> None:
         if self.global_config.debug:
             self.logger.debug("Calculating noise metrics using minimal variation regions")
@@ -218,7 +227,7 @@ class ChromatogramAnalyzer(Configurable[ChromatogramAnalyzerConfig]):
             if noise_variance > self.config.max_noise_variance and self.global_config.debug:
                 self.logger.warning(f"High variance in noise estimates: {noise_variance:.2e}")
 
-        signal_range = float(np.max(chrom.intensity) - np.min(chrom.intensity))
+        signal_range = chrom.metadata['y_max'] - chrom.metadata['y_min']
         snr = float('inf') if noise_level == 0 else signal_range / noise_level
 
         if self.global_config.debug:
@@ -273,7 +282,7 @@ class ChromatogramAnalyzer(Configurable[ChromatogramAnalyzerConfig]):
 
         skewness = float(stats.skew(chrom.intensity))
         kurtosis = float(stats.kurtosis(chrom.intensity))
-        dynamic_range = float(np.max(chrom.intensity) - np.min(chrom.intensity))
+        dynamic_range = chrom.metadata['y_max'] - chrom.metadata['y_min']
 
         if self.global_config.debug:
             self.logger.debug(f"Distribution metrics - skewness: {skewness:.2f}, kurtosis: {kurtosis:.2f}, range: {dynamic_range:.2f}")
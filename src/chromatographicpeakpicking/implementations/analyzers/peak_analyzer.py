@@ -9,6 +9,7 @@ from src.chromatographicpeakpicking.core.types.config import BaseConfig, ConfigM
 from src.chromatographicpeakpicking.core.types.validation import ValidationResult
 from src.chromatographicpeakpicking.core.domain.chromatogram import Chromatogram
 from src.chromatographicpeakpicking.core.domain.peak import Peak
+from src.chromatographicpeakpicking.core.prototypes.peak_batch import peak_column
 
 @dataclass
 class PeakAnalyzerConfig(BaseConfig):
@@ -162,13 +163,14 @@ class PeakAnalyzer(Configurable[PeakAnalyzerConfig]):
 
     @staticmethod
     def _calculate_peak_resolution(x: np.ndarray, y: np.ndarray, peak: Peak, peaks: List[Peak]) -> Peak:
-        all_peak_indices = [p['index'] for p in peaks]
+        # Read the apex indices as one column rather than peak by peak
+        all_peak_indices = peak_column(peaks, 'index', dtype=np.intp)
         if len(all_peak_indices) < 2:
             peak['resolution'] = float('inf')
             return peak
 
-        distances = np.abs(np.array(all_peak_indices) - peak['index'])
-        nearest = all_peak_indices[np.argsort(distances)[1]]
+        distances = np.abs(all_peak_indices - peak['index'])
+        nearest = int(all_peak_indices[np.argsort(distances)[1]])
         delta_t = abs(x[peak['index']] - x[nearest])
         peak['resolution'] = 2 * delta_t / (peak['width'] + peak_widths(y, [nearest])[0][0])
         return peak
@@ -2,11 +2,36 @@
 
 """
 Cache for storing analysis results.
+
+Entries are kept in least-recently-used order and evicted once the cache grows
+past ``max_entries``. An optional time-to-live expires stale entries on access.
+Functions can be memoized through the cache with ``ResultCache.memoize``.
 """
 
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from functools import wraps
+from typing import Any, Optional, Tuple
+
+_MISSING = object()
+
 class ResultCache:
-    def __init__(self):
-        self.cache = {}
+    __slots__ = ('max_entries', 'ttl', 'cache')
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[timedelta] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of results to keep before evicting the
+                least recently used one.
+            ttl (Optional[timedelta]): How long a result stays valid. ``None`` disables expiry.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.cache: 'OrderedDict[Any, Tuple[Any, datetime]]' = OrderedDict()
 
     def get(self, key):
         """
@@ -15,7 +40,23 @@ class ResultCache:
         Args:
             key: The key for the cached result.
         """
-        return self.cache.get(key)
+        value = self._lookup(key)
+        return None if value is _MISSING else value
+
+    def _lookup(self, key):
+        """
+        Retrieve a result, returning the ``_MISSING`` sentinel on a miss so that
+        cached ``None`` results can be told apart from absent ones.
+        """
+        entry = self.cache.get(key)
+        if entry is None:
+            return _MISSING
+        value, timestamp = entry
+        if self.ttl is not None and datetime.now() - timestamp > self.ttl:
+            del self.cache[key]
+            return _MISSING
+        self.cache.move_to_end(key)
+        return value
 
     def set(self, key, value):
         """
@@ -25,7 +66,10 @@ class ResultCache:
             key: The key for the result.
             value: The result to store.
         """
-        self.cache[key] = value
+        self.cache[key] = (value, datetime.now())
+        self.cache.move_to_end(key)
+        if len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)
 
     def invalidate(self, key):
         """
@@ -34,11 +78,29 @@ class ResultCache:
         Args:
             key: The key for the result to invalidate.
         """
-        if key in self.cache:
-            del self.cache[key]
+        self.cache.pop(key, None)
 
     def clear(self):
         """
         Clear the entire cache.
         """
         self.cache.clear()
+
+    def memoize(self, func):
+        """
+        Decorate a function so its results are stored in this cache.
+
+        Results are keyed on the function and its arguments, which must be hashable.
+
+        Args:
+            func: The function to memoize.
+        """
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func, args, tuple(sorted(kwargs.items())))
+            value = self._lookup(key)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                self.set(key, value)
+            return value
+        return wrapper
@@ -1,7 +1,8 @@
 from .analysis_logger import AnalysisLogger
-from .performance_logger import PerformanceLogger
+from .performance_logger import PerformanceLog, PerformanceLogger
 
 __all__ = [
     'AnalysisLogger',
+    'PerformanceLog',
     'PerformanceLogger'
 ]
@@ -3,11 +3,26 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import logging
+import logging.handlers
 import traceback
 from pathlib import Path
 import json
 import uuid
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+def _to_json(data: Dict[str, Any]) -> str:
+    """Serialize a log payload as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+    return json.dumps(data, indent=2)
+
 @dataclass
 class AnalysisLogger:
     """Logger for analysis operations and performance tracking."""
@@ -15,6 +30,7 @@ class AnalysisLogger:
     log_path: Path
     level: int = logging.INFO
     _logger: logging.Logger = field(init=False)
+    _buffered_handler: logging.handlers.MemoryHandler = field(init=False, repr=False)
     _session_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     _start_time: Optional[datetime] = field(default=None)
 
@@ -26,9 +42,17 @@ class AnalysisLogger:
         # Ensure log directory exists
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create file handler
+        # Create file handler; records are buffered in memory and written in batches,
+        # with errors forcing an immediate flush so failures reach disk right away
         file_handler = logging.FileHandler(self.log_path)
         file_handler.setLevel(self.level)
+        self._buffered_handler = logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        self._buffered_handler.setLevel(self.level)
 
         # Create console handler
         console_handler = logging.StreamHandler()
@@ -42,37 +66,42 @@ class AnalysisLogger:
         console_handler.setFormatter(formatter)
 
         # Add handlers to logger
-        self._logger.addHandler(file_handler)
+        self._logger.addHandler(self._buffered_handler)
         self._logger.addHandler(console_handler)
 
     def log_analysis_start(self, parameters: Dict[str, Any]) -> None:
         """Log the start of an analysis process."""
         self._start_time = datetime.now()
-        self._logger.info(
-            f"Analysis started - Session ID: {self._session_id}\n"
-            f"Parameters: {json.dumps(parameters, indent=2)}"
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                f"Analysis started - Session ID: {self._session_id}\n"
+                f"Parameters: {_to_json(parameters)}"
+            )
 
     def log_analysis_step(self, step: str, metrics: Dict[str, Any]) -> None:
         """Log completion of an analysis step with metrics."""
-        self._logger.info(
-            f"Step completed - {step}\n"
-            f"Metrics: {json.dumps(metrics, indent=2)}"
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                f"Step completed - {step}\n"
+                f"Metrics: {_to_json(metrics)}"
+            )
 
     def log_analysis_end(self, results: Dict[str, Any]) -> None:
         """Log analysis completion with results and duration."""
         if self._start_time:
-            duration = datetime.now() - self._start_time
-            self._logger.info(
-                f"Analysis completed - Session ID: {self._session_id}\n"
-                f"Duration: {duration}\n"
-                f"Results: {json.dumps(results, indent=2)}"
-            )
+            if self._logger.isEnabledFor(logging.INFO):
+                duration = datetime.now() - self._start_time
+                self._logger.info(
+                    f"Analysis completed - Session ID: {self._session_id}\n"
+                    f"Duration: {duration}\n"
+                    f"Results: {_to_json(results)}"
+                )
         else:
             self._logger.warning(
                 "Analysis end logged without corresponding start log"
             )
+        # The analysis is over, so write out everything still buffered
+        self.flush()
 
     def log_error(self, error: Exception, context: Dict[str, Any] = None) -> None:
         """Log an error with full traceback and context."""
@@ -86,7 +115,7 @@ class AnalysisLogger:
 
         self._logger.error(
             f"Error occurred - Session ID: {self._session_id}\n"
-            f"Error details: {json.dumps(error_info, indent=2)}"
+            f"Error details: {_to_json(error_info)}"
         )
 
     def log_warning(self, message: str, context: Dict[str, Any] = None) -> None:
@@ -99,22 +128,28 @@ class AnalysisLogger:
 
         self._logger.warning(
             f"Warning - Session ID: {self._session_id}\n"
-            f"Details: {json.dumps(warning_info, indent=2)}"
+            f"Details: {_to_json(warning_info)}"
         )
 
     def log_performance_metrics(self, metrics: Dict[str, Any]) -> None:
         """Log performance metrics from analysis."""
-        self._logger.info(
-            f"Performance metrics - Session ID: {self._session_id}\n"
-            f"Metrics: {json.dumps(metrics, indent=2)}"
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                f"Performance metrics - Session ID: {self._session_id}\n"
+                f"Metrics: {_to_json(metrics)}"
+            )
 
     def log_validation_results(self, results: Dict[str, Any]) -> None:
         """Log validation results from data processing."""
-        self._logger.info(
-            f"Validation results - Session ID: {self._session_id}\n"
-            f"Results: {json.dumps(results, indent=2)}"
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                f"Validation results - Session ID: {self._session_id}\n"
+                f"Results: {_to_json(results)}"
+            )
+
+    def flush(self) -> None:
+        """Write all buffered log records to the log file."""
+        self._buffered_handler.flush()
 
     def get_session_id(self) -> str:
         """Return the current session ID."""
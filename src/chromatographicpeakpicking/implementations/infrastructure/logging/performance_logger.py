@@ -2,11 +2,35 @@
 
 """
 Logger for performance metrics.
+
+Operations are indexed by name as they are logged, so per-operation history and
+averages are answered without scanning the full log. Histories are kept in
+fixed-size ring buffers so long-running analyses do not grow the log without
+bound; averages still cover every logged operation.
 """
 
+from collections import defaultdict, deque
+from typing import NamedTuple
+
+DEFAULT_MAX_HISTORY = 16384
+
+class PerformanceLog(NamedTuple):
+    """A single logged operation."""
+    operation_name: str
+    duration: float
+
 class PerformanceLogger:
-    def __init__(self):
-        self.operations = []
+    def __init__(self, max_history=DEFAULT_MAX_HISTORY):
+        """
+        Args:
+            max_history (int, optional): Number of most recent entries kept, overall
+                and per operation. None keeps every entry.
+        """
+        self.max_history = max_history
+        self.operations = deque(maxlen=max_history)
+        self._by_operation = defaultdict(lambda: deque(maxlen=max_history))
+        self._count = defaultdict(int)
+        self._total_duration = defaultdict(float)
 
     def log_operation(self, operation_name, duration):
         """
@@ -16,13 +40,22 @@ class PerformanceLogger:
             operation_name (str): The name of the operation.
             duration (float): The duration of the operation in seconds.
         """
-        self.operations.append((operation_name, duration))
+        entry = PerformanceLog(operation_name, duration)
+        self.operations.append(entry)
+        self._by_operation[operation_name].append(entry)
+        self._count[operation_name] += 1
+        self._total_duration[operation_name] += duration
 
-    def get_operation_history(self):
+    def get_operation_history(self, operation_name=None):
         """
-        Retrieve the history of logged operations.
+        Retrieve the retained history of logged operations, oldest first.
+
+        Args:
+            operation_name (str, optional): Only return entries for this operation.
         """
-        return self.operations
+        if operation_name is None:
+            return self.operations
+        return self._by_operation.get(operation_name, ())
 
     def get_average_duration(self, operation_name):
         """
@@ -31,5 +64,5 @@ class PerformanceLogger:
         Args:
             operation_name (str): The name of the operation.
         """
-        durations = [duration for name, duration in self.operations if name == operation_name]
-        return sum(durations) / len(durations) if durations else 0.0
+        count = self._count.get(operation_name, 0)
+        return self._total_duration[operation_name] / count if count else 0.0
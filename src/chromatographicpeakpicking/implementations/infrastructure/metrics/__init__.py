@@ -1,5 +1,6 @@
-from .performance_metrics import PerformanceMetrics
+from .performance_metrics import OperationMetrics, PerformanceMetrics
 
 __all__ = [
+    'OperationMetrics',
     'PerformanceMetrics'
 ]
@@ -1,9 +1,12 @@
 # src/chromatographicpeakpicking/infrastructure/metrics/chromatogram_metrics.py
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 class ChromatogramMetrics:
     """Class to store and manage chromatogram metrics."""
 
+    __slots__ = ('metrics',)
+
     def __init__(self):
         self.metrics: Dict[str, Any] = {}
 
@@ -13,5 +16,5 @@ class ChromatogramMetrics:
     def get_metric(self, key: str) -> Any:
         return self.metrics.get(key)
 
-    def get_all_metrics(self) -> Dict[str, Any]:
-        return self.metrics
+    def get_all_metrics(self) -> Mapping[str, Any]:
+        return MappingProxyType(self.metrics)
@@ -2,10 +2,79 @@
 
 """
 Performance metrics tracking.
+
+Durations are measured with the monotonic nanosecond counter and kept as integers;
+they are converted to seconds only when statistics are reported.
 """
 
+from dataclasses import dataclass
+from typing import Optional
 import time
 
+_NS_PER_SECOND = 1_000_000_000
+
+@dataclass(slots=True)
+class OperationMetrics:
+    """
+    Timing record for a tracked operation.
+
+    Attributes:
+        start_time (float): Wall-clock time at which the latest run started.
+        start_ns (int): Monotonic counter value at which the latest run started.
+        duration_ns (Optional[int]): How long the latest run took, once it has ended.
+        count (int): Number of completed runs.
+        total_ns (int): Summed duration of all completed runs.
+        min_ns (int): Shortest completed run.
+        max_ns (int): Longest completed run.
+    """
+    start_time: float
+    start_ns: int
+    duration_ns: Optional[int] = None
+    count: int = 0
+    total_ns: int = 0
+    min_ns: int = 0
+    max_ns: int = 0
+
+    def restart(self):
+        """
+        Begin a new run of the operation.
+        """
+        self.start_time = time.time()
+        self.duration_ns = None
+        self.start_ns = time.perf_counter_ns()
+
+    def record(self, end_ns):
+        """
+        Complete the current run and fold its duration into the running aggregates.
+
+        Args:
+            end_ns (int): Monotonic counter value at which the run ended.
+        """
+        duration = end_ns - self.start_ns
+        self.duration_ns = duration
+        if self.count == 0 or duration < self.min_ns:
+            self.min_ns = duration
+        if self.count == 0 or duration > self.max_ns:
+            self.max_ns = duration
+        self.count += 1
+        self.total_ns += duration
+
+    def to_dict(self):
+        """
+        Convert the record to the dictionary form returned by get_operation_stats.
+
+        Durations are reported in seconds.
+        """
+        stats = {"start_time": self.start_time}
+        if self.duration_ns is not None:
+            stats["duration"] = self.duration_ns / _NS_PER_SECOND
+        if self.count:
+            stats["count"] = self.count
+            stats["min_duration"] = self.min_ns / _NS_PER_SECOND
+            stats["max_duration"] = self.max_ns / _NS_PER_SECOND
+            stats["avg_duration"] = self.total_ns / self.count / _NS_PER_SECOND
+        return stats
+
 class PerformanceMetrics:
     def __init__(self):
         self.metrics = {}
@@ -17,18 +86,30 @@ class PerformanceMetrics:
         Args:
             operation_name (str): The name of the operation.
         """
-        self.metrics[operation_name] = {"start_time": time.time()}
+        operation = self.metrics.get(operation_name)
+        if operation is None:
+            self.metrics[operation_name] = OperationMetrics(
+                start_time=time.time(),
+                start_ns=time.perf_counter_ns()
+            )
+        else:
+            # Restarting an operation reuses its record instead of allocating a new one
+            operation.restart()
 
     def end_operation(self, operation_name):
         """
         End tracking an operation and record its duration.
 
+        Ending an operation that is not running has no effect, so each run is
+        counted once in the aggregate statistics.
+
         Args:
             operation_name (str): The name of the operation.
         """
-        if operation_name in self.metrics and "start_time" in self.metrics[operation_name]:
-            start_time = self.metrics[operation_name]["start_time"]
-            self.metrics[operation_name]["duration"] = time.time() - start_time
+        end_ns = time.perf_counter_ns()
+        operation = self.metrics.get(operation_name)
+        if operation is not None and operation.duration_ns is None:
+            operation.record(end_ns)
 
     def get_operation_stats(self, operation_name):
         """
@@ -37,4 +118,5 @@ class PerformanceMetrics:
         Args:
             operation_name (str): The name of the operation.
         """
-        return self.metrics.get(operation_name, {})
+        operation = self.metrics.get(operation_name)
+        return operation.to_dict() if operation is not None else {}
@@ -31,6 +31,15 @@ class PeakRepository(BaseRepository):
     def get_all(self):
         """
         Retrieve all peaks from the repository.
+
+        Returns a live view rather than a copy; use get_all_snapshot() when the
+        repository may be modified while iterating.
+        """
+        return self.peaks.values()
+
+    def get_all_snapshot(self):
+        """
+        Retrieve a list copy of all peaks in the repository.
         """
         return list(self.peaks.values())
 
@@ -1,4 +1,5 @@
 # src/chromatographicpeakpicking/io/formats/csv_format.py
+import codecs
 from pathlib import Path
 from typing import Dict, Any
 import pandas as pd
@@ -8,18 +9,30 @@ class CSVFormatHandler(FormatHandler):
     """Handles CSV file format operations."""
 
     async def validate(self, path: Path) -> bool:
-        """Validate if file is valid CSV."""
+        """Validate if file is valid CSV.
+
+        Only the first few kilobytes are inspected: the file must be non-empty,
+        UTF-8 text without NUL bytes.
+        """
         if not path.suffix.lower() == '.csv':
             return False
 
         try:
-            pd.read_csv(path, nrows=1)
-            return True
-        except Exception:
+            with path.open('rb') as f:
+                sample = f.read(4096)
+            # Incremental decoding tolerates a multi-byte character cut off by the sample size
+            text = codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        except (OSError, UnicodeDecodeError):
             return False
+        return bool(text.strip()) and '\x00' not in text
 
     async def read(self, path: Path) -> Dict[str, Any]:
-        """Read CSV file into dictionary."""
+        """Read CSV file into dictionary.
+
+        Data is returned as one dictionary per row, like the other format handlers.
+        The default C parser is used on purpose: the pyarrow parser infers date-like
+        columns and would return date/timestamp values where callers expect strings.
+        """
         df = pd.read_csv(path)
         return {
             'data': df.to_dict('records'),
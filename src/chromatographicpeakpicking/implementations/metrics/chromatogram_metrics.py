@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 from ..core.protocols import Metrics
 
-@dataclass
+@dataclass(slots=True)
 class ChromatogramMetrics(Metrics):
     """Implementation of metrics storage for chromatograms.
 
@@ -35,9 +36,17 @@ class ChromatogramMetrics(Metrics):
         """
         self.metrics[metric_name] = value
 
-    def get_all_metrics(self) -> Dict[str, float]:
+    def get_all_metrics(self) -> Mapping[str, float]:
         """Get all stored metrics.
 
+        Returns:
+            Read-only view of all stored metrics
+        """
+        return MappingProxyType(self.metrics)
+
+    def copy_metrics(self) -> Dict[str, float]:
+        """Get an independent copy of all stored metrics.
+
         Returns:
             Dictionary containing all stored metrics
         """
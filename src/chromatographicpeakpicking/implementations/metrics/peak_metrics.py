@@ -1,6 +1,7 @@
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 from .Imetrics import IMetrics
 
@@ -41,9 +42,18 @@ class PeakMetrics(IMetrics):
         self.metrics[metric_name] = value
 
 
-    def get_all_metrics(self) -> Dict[str, float]:
+    def get_all_metrics(self) -> Mapping[str, float]:
         """Get all stored metrics.
 
+        Returns:
+            Read-only view of all stored metrics
+        """
+        return MappingProxyType(self.metrics)
+
+
+    def copy_metrics(self) -> Dict[str, float]:
+        """Get an independent copy of all stored metrics.
+
         Returns:
             Dictionary containing all stored metrics
         """
@@ -4,6 +4,8 @@ This module defines the AnalysisPipeline class, which is used to represent and e
 chromatographic analysis pipeline.
 """
 
+import asyncio
+from itertools import chain
 from typing import Optional, Union, List
 from ..core.protocols.correctable import Correctable
 from ..core.protocols.detectable import Detectable
@@ -12,6 +14,8 @@ from ..core.protocols.selectable import Selectable
 class AnalysisPipeline:
     """Represents a complete analysis pipeline."""
 
+    __slots__ = ('correctors', 'detectors', 'selectors')
+
     def __init__(self,
                  corrector: Optional[Union[Correctable, List[Correctable]]] = None,
                  detector: Optional[Union[Detectable, List[Detectable]]] = None,
@@ -44,13 +48,23 @@ class AnalysisPipeline:
         for corrector in self.correctors:
             data = corrector.correct(data)
 
-        # Apply each detector in order
-        peaks = []
-        for detector in self.detectors:
-            peaks = detector.detect(data)
+        # Collect the peaks found by every detector
+        peaks = list(chain.from_iterable(
+            detector.detect(data) for detector in self.detectors
+        ))
 
         # Apply each selector in order
         for selector in self.selectors:
             peaks = selector.select(peaks)
 
         return peaks
+
+    async def run_async(self, data):
+        """Run the analysis pipeline without blocking the event loop.
+
+        This exists only for event-loop integration: the whole pipeline runs
+        sequentially, exactly as in run(), in a single worker thread. It gives no
+        parallel speed-up, and detectors are never run concurrently since they are
+        not known to be thread-safe.
+        """
+        return await asyncio.to_thread(self.run, data)
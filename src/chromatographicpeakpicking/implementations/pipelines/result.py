@@ -1,6 +1,8 @@
 # src/chromatographicpeakpicking/core/pipeline/result.py
 from dataclasses import dataclass, field
-from typing import TypeVar, Generic, Dict, Any, List
+from functools import cached_property
+from types import MappingProxyType
+from typing import TypeVar, Generic, Dict, Any, Mapping, Tuple
 from ..core.types.errors import ProcessingError
 
 T = TypeVar('T')
@@ -12,17 +14,21 @@ class StageResult(Generic[T]):
 
    Attributes:
        output: The stage's output data
-       metadata: Additional metadata about the execution
+       metadata: Additional metadata about the execution, as a read-only view
        errors: Processing errors that occurred
        warnings: Processing warnings that occurred
        execution_time: Time taken to execute in seconds
    """
    output: T
-   metadata: Dict[str, Any]
-   errors: List[ProcessingError]
-   warnings: List[ProcessingError]
+   metadata: Mapping[str, Any] = field(hash=False)
+   errors: Tuple[ProcessingError, ...]
+   warnings: Tuple[ProcessingError, ...]
    execution_time: float
 
+   def __post_init__(self):
+       """Copy the metadata into a read-only view so the result cannot be changed."""
+       object.__setattr__(self, 'metadata', MappingProxyType(dict(self.metadata)))
+
 @dataclass(frozen=True)
 class PipelineResult(Generic[T]):
    """
@@ -30,9 +36,23 @@ class PipelineResult(Generic[T]):
 
    Attributes:
        final_output: The pipeline's final output
-       stage_results: Results from individual stages
+       stage_results: (name, result) pairs for individual stages, in execution order
        total_time: Total execution time in seconds
    """
    final_output: T
-   stage_results: Dict[str, StageResult]
+   stage_results: Tuple[Tuple[str, StageResult], ...]
    total_time: float
+
+   @cached_property
+   def _stage_index(self) -> Dict[str, StageResult]:
+       """Name-to-result lookup built on first access."""
+       return dict(self.stage_results)
+
+   def get_stage(self, name: str) -> StageResult:
+       """
+       Get the result of a stage by name.
+
+       Raises:
+           KeyError: If no stage with the given name was executed
+       """
+       return self._stage_index[name]
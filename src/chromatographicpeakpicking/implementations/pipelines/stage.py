@@ -21,6 +21,8 @@ class PipelineStage(ABC, Generic[Input, Output, Config]):
     and validation.
     """
 
+    __slots__ = ('name', '_error_handler', '_config')
+
     def __init__(self,
                  name: str,
                  error_handler: ErrorHandler,
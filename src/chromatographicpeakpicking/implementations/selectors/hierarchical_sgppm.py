@@ -5,93 +5,163 @@ from typing import List, Dict, Tuple, Union
 from ..core.building_block import BuildingBlock
 from ..core.chromatogram import Chromatogram
 from ..core.hierarchy import Hierarchy
+from ..core.peak_batch import peak_column
 from .sgppm import SGPPM
 from ..configs.sgppm_config import SGPPMConfig
+from ..infrastructure.caching.result_cache import ResultCache
+from utilities.configure_logger import configure_logger
 
 @dataclass
 class HierarchicalSGPPM(SGPPM):
     config: SGPPMConfig = field(default_factory=SGPPMConfig)
-    debug: bool = True
+    debug: bool = False
+    # Number of base-sequence hierarchies kept, least recently used evicted first
+    hierarchy_cache_size: int = 16
+    _hierarchy_cache: ResultCache = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Initialize processing stages and a logger honouring either debug flag."""
+        super().__post_init__()
+        self._hierarchy_cache = ResultCache(max_entries=self.hierarchy_cache_size)
+        # Debug output is gated on this instance's flags, not on the shared logger's level
+        self._debug = self.debug or self.global_config.debug
+        self.logger = configure_logger(__name__, self._debug)
 
     def pick_peaks(self, chromatograms: Union[List[Chromatogram], Chromatogram]) -> Union[List[Chromatogram], Chromatogram]:
         if isinstance(chromatograms, Chromatogram):
             chromatograms = [chromatograms]
 
-        # Create local hierarchy and elution times for this set of chromatograms
-        sequence_hierarchy = Hierarchy(null_element=BuildingBlock(name='Null'))
-        elution_times: Dict[Tuple[BuildingBlock, ...], float] = {}
-        peak_intensities: Dict[Tuple[BuildingBlock, ...], float] = {}
-
-        # Generate mapping of building block tuples to chromatograms
+        # Generate mapping of building block tuples to chromatograms. Each tuple is built
+        # once per call and looked up by chromatogram id in later steps, so nothing is
+        # cached on the caller's chromatograms
+        chrom_sequences = {
+            id(chrom): tuple(chrom.building_blocks or ()) for chrom in chromatograms
+        }
         sequence_to_chrom = {
-            tuple(chrom.building_blocks or ()): chrom for chrom in chromatograms
+            chrom_sequences[id(chrom)]: chrom for chrom in chromatograms
         }
 
         # Get base sequence and generate hierarchy
-        base_sequence = max(
-            sequence_to_chrom.keys(),
-            key=lambda seq: sum(bool(x.name != 'Null')
-                            for x in seq)
+        candidates = list(sequence_to_chrom)
+        non_null_counts = np.fromiter(
+            (sum(1 for x in seq if not x.is_null) for seq in candidates),
+            dtype=np.int32,
+            count=len(candidates)
         )
+        base_sequence = candidates[int(non_null_counts.argmax())]
+
+        # Plates typically share a base sequence, so its hierarchy is built once and reused
+        hierarchy = self._hierarchy_cache.get(base_sequence)
+        if hierarchy is None:
+            hierarchy = self._build_hierarchy(base_sequence)
+            self._hierarchy_cache.set(base_sequence, hierarchy)
+        sequence_hierarchy, sequence_ids, descendant_ids = hierarchy
+
+        # Elution times and intensities live in dense arrays indexed by sequence id,
+        # with NaN marking sequences that have no picked peak yet
+        elution_times = np.full(len(sequence_ids), np.nan)
+        peak_intensities = np.zeros(len(sequence_ids))
+
+        # Bucket the chromatograms in the hierarchy by level in a single pass
+        level_chroms: Dict[int, List[Chromatogram]] = {}
+        for sequence, chrom in sequence_to_chrom.items():
+            if sequence in sequence_ids:
+                level_chroms.setdefault(sequence_hierarchy.get_level(sequence), []).append(chrom)
+
+        # Hierarchy constraints narrow each chromatogram's peak search window for this
+        # call only: every search starts from the full signal, and the window is
+        # restored afterwards so it never carries over to later runs
+        for chrom in chromatograms:
+            chrom.valid_start_idx = 0
+        try:
+            # Process chromatograms by level
+            results = []
+            for level in range(len(base_sequence) + 1):
+                if level_chromatograms := level_chroms.get(level, []):
+                    if self._debug:
+                        self.logger.debug("Processing Level %d", level)
+
+                    # Process this level
+                    processed_chroms = self._process_level(
+                        level_chromatograms,
+                        level,
+                        chrom_sequences,
+                        sequence_hierarchy,
+                        descendant_ids,
+                        elution_times,
+                        peak_intensities
+                    )
+
+                    # Update times and intensities
+                    for chrom in processed_chroms:
+                        sequence = chrom_sequences[id(chrom)]
+                        if chrom.picked_peak:
+                            sequence_id = sequence_ids[sequence]
+                            elution_times[sequence_id] = chrom.picked_peak['time']
+                            peak_intensities[sequence_id] = chrom.picked_peak['height']
+                            if self._debug:
+                                self.logger.debug("Sequence: %s", '-'.join(bb.name for bb in sequence if not bb.is_null))
+                                self.logger.debug("  Peak time: %.2f", chrom.picked_peak['time'])
+                                self.logger.debug("  Peak height: %.2f", chrom.picked_peak['height'])
+
+                    results.extend(processed_chroms)
+        finally:
+            for chrom in chromatograms:
+                chrom.valid_start_idx = 0
+
+        return results[0] if len(chromatograms) == 1 else results
+
+    def _build_hierarchy(
+        self,
+        base_sequence: Tuple[BuildingBlock, ...]
+    ) -> Tuple[
+        Hierarchy,
+        Dict[Tuple[BuildingBlock, ...], int],
+        Dict[Tuple[BuildingBlock, ...], np.ndarray]
+    ]:
+        """Build the hierarchy of a base sequence and the lookups derived from it"""
+        sequence_hierarchy = Hierarchy(null_element=BuildingBlock(name='Null'))
         all_sequences = sequence_hierarchy.generate_all_descendants(base_sequence)
         all_sequences.append(base_sequence)
         sequence_hierarchy.add_sequences(all_sequences)
 
-        # Process chromatograms by level
-        results = []
-        for level in range(len(base_sequence) + 1):
-            sequences = sequence_hierarchy.get_sequences_by_level(level)
-            if level_chromatograms := [
-                sequence_to_chrom[seq]
-                for seq in sequences
-                if seq in sequence_to_chrom
-            ]:
-                if self.debug:
-                    print(f"\nProcessing Level {level}")
-
-                # Process this level
-                processed_chroms = self._process_level(
-                    level_chromatograms,
-                    level,
-                    sequence_hierarchy,
-                    elution_times,
-                    peak_intensities
-                )
-
-                # Update times and intensities
-                for chrom in processed_chroms:
-                    sequence = tuple(chrom.building_blocks or ())
-                    if chrom.picked_peak:
-                        elution_times[sequence] = chrom.picked_peak['time']
-                        peak_intensities[sequence] = chrom.picked_peak['height']
-                        if self.debug:
-                            print(f"Sequence: {'-'.join(bb.name for bb in sequence if bb.name != None)}")
-                            print(f"  Peak time: {chrom.picked_peak['time']:.2f}")
-                            print(f"  Peak height: {chrom.picked_peak['height']:.2f}")
-
-                results.extend(processed_chroms)
+        # Index sequences so per-sequence results can be stored in dense arrays
+        sequence_ids = {sequence: i for i, sequence in enumerate(all_sequences)}
 
-        return results[0] if len(chromatograms) == 1 else results
+        # Descendant lookups are shared by constraint and selection steps on every level
+        descendant_ids = {
+            sequence: np.fromiter(
+                (sequence_ids[desc] for desc in sequence_hierarchy.get_descendants(sequence)
+                 if desc in sequence_ids),
+                dtype=np.intp
+            )
+            for sequence in all_sequences
+        }
+
+        return sequence_hierarchy, sequence_ids, descendant_ids
 
     def _process_level(
         self,
         chromatograms: List[Chromatogram],
         level: int,
+        chrom_sequences: Dict[int, Tuple[BuildingBlock, ...]],
         sequence_hierarchy: Hierarchy,
-        elution_times: Dict[Tuple[BuildingBlock, ...], float],
-        peak_intensities: Dict[Tuple[BuildingBlock, ...], float]
+        descendant_ids: Dict[Tuple[BuildingBlock, ...], np.ndarray],
+        elution_times: np.ndarray,
+        peak_intensities: np.ndarray
     ) -> List[Chromatogram]:
         """Process chromatograms at a specific level of the hierarchy"""
-        if self.debug:
-            print(f"\nProcessing level {level} chromatograms")
+        if self._debug:
+            self.logger.debug("Processing level %d chromatograms", level)
 
         # Prepare chromatograms
         chromatograms = self._prepare_chromatograms(chromatograms)
 
-        # For higher levels, create search masks
-        if level > 0:
+        # For higher levels, create search masks; skip this while no sequence has a
+        # picked peak, since there are no descendant times to constrain against
+        if level > 0 and not np.isnan(elution_times).all():
             chromatograms = self._apply_hierarchy_constraints(
-                chromatograms, sequence_hierarchy, elution_times
+                chromatograms, chrom_sequences, descendant_ids, elution_times
             )
 
         # Use base class peak finding
@@ -99,7 +169,7 @@ class HierarchicalSGPPM(SGPPM):
 
         # Apply hierarchical peak selection
         chromatograms = self._hierarchical_peak_selection(
-            chromatograms, sequence_hierarchy, peak_intensities
+            chromatograms, chrom_sequences, sequence_hierarchy, descendant_ids, peak_intensities
         )
 
         return chromatograms
@@ -107,72 +177,81 @@ class HierarchicalSGPPM(SGPPM):
     def _apply_hierarchy_constraints(
         self,
         chromatograms: List[Chromatogram],
-        sequence_hierarchy: Hierarchy,
-        elution_times: Dict[Tuple[BuildingBlock, ...], float]
+        chrom_sequences: Dict[int, Tuple[BuildingBlock, ...]],
+        descendant_ids: Dict[Tuple[BuildingBlock, ...], np.ndarray],
+        elution_times: np.ndarray
     ) -> List[Chromatogram]:
         """Apply hierarchy constraints to chromatograms"""
+        # Collect the earliest allowed time for every constrained chromatogram
+        constrained = []
+        min_times = []
         for chrom in chromatograms:
-            sequence = tuple(chrom.building_blocks or ())
-
-            # Get descendants and their times
-            descendants = sequence_hierarchy.get_descendants(sequence)
-            if valid_times := [
-                elution_times[desc]
-                for desc in descendants
-                if desc in elution_times
-            ]:
-                min_time = max(valid_times) + self.config.peak_time_threshold
-                min_idx = np.searchsorted(chrom.x, min_time)
-
-                # Zero out signal before minimum time
-                if chrom.y_corrected is not None:
-                    chrom.y_corrected[:min_idx] = 0
-
-                if self.debug:
-                    print(f"Sequence: {'-'.join(bb.name for bb in sequence if bb.name != None)}")
-                    print(f"  Minimum allowed time: {min_time:.2f}")
-                    if chrom.y_corrected is not None:
-                        remaining_signal = np.any(chrom.y_corrected[min_idx:] > 0)
-                        print(f"  Signal remains after constraint: {remaining_signal}")
+            # Gather the elution times of descendants that have a picked peak
+            valid_times = elution_times[descendant_ids[chrom_sequences[id(chrom)]]]
+            valid_times = valid_times[~np.isnan(valid_times)]
+            if valid_times.size:
+                constrained.append(chrom)
+                min_times.append(valid_times.max() + self.config.peak_time_threshold)
+
+        if not constrained:
+            return chromatograms
+
+        # Chromatograms sharing one time grid are searched in a single batched call
+        min_times = np.asarray(min_times)
+        shared_x = constrained[0].x
+        if all(chrom.x is shared_x for chrom in constrained):
+            min_idxs = np.searchsorted(shared_x, min_times)
+        else:
+            min_idxs = [np.searchsorted(chrom.x, min_time) for chrom, min_time in zip(constrained, min_times)]
+
+        for chrom, min_time, min_idx in zip(constrained, min_times, min_idxs):
+            # Restrict the peak search to signal after the minimum time
+            chrom.valid_start_idx = int(min_idx)
+
+            if self._debug:
+                sequence = chrom_sequences[id(chrom)]
+                self.logger.debug("Sequence: %s", '-'.join(bb.name for bb in sequence if not bb.is_null))
+                self.logger.debug("  Minimum allowed time: %.2f", min_time)
+                self.logger.debug("  Peak search starts at index %d", chrom.valid_start_idx)
 
         return chromatograms
 
     def _hierarchical_peak_selection(
         self,
         chromatograms: List[Chromatogram],
+        chrom_sequences: Dict[int, Tuple[BuildingBlock, ...]],
         sequence_hierarchy: Hierarchy,
-        peak_intensities: Dict[Tuple[BuildingBlock, ...], float]
+        descendant_ids: Dict[Tuple[BuildingBlock, ...], np.ndarray],
+        peak_intensities: np.ndarray
     ) -> List[Chromatogram]:
         """Select peaks considering hierarchical relationships"""
         for chrom in chromatograms:
             if not chrom.peaks:
                 continue
 
-            sequence = tuple(chrom.building_blocks or ())
+            sequence = chrom_sequences[id(chrom)]
             level = sequence_hierarchy.get_level(sequence)
 
             # Get maximum intensity from descendants
-            descendants = sequence_hierarchy.get_descendants(sequence)
-            max_descendant_intensity = max(
-                (peak_intensities.get(desc, 0) for desc in descendants), default=0
+            max_descendant_intensity = float(
+                peak_intensities[descendant_ids[sequence]].max(initial=0.0)
             )
 
-            # Filter peaks based on hierarchy constraints
-            valid_peaks = []
-            for peak in chrom.peaks:
-                peak_height = peak['height']
-
-                # Basic threshold check
-                if peak_height >= self.config.height_threshold and (level == 0 or peak_height > max_descendant_intensity):
-                    valid_peaks.append(peak)
+            # Filter peaks based on hierarchy constraints in one vectorized pass, reading
+            # the PeakBatch columns directly rather than peak by peak
+            heights = peak_column(chrom.peaks, 'height')
+            times = peak_column(chrom.peaks, 'time')
+            valid = heights >= self.config.height_threshold
+            if level > 0:
+                valid &= heights > max_descendant_intensity
 
             # Select latest eluting valid peak
-            if valid_peaks:
-                chrom.picked_peak = max(valid_peaks, key=lambda p: p['time'])
-                if self.debug:
-                    print(f"Selected peak for {'-'.join(bb.name for bb in sequence if bb.name != None)}")
-                    print(f"  Time: {chrom.picked_peak['time'] if chrom.picked_peak else np.NaN:.2f}")
-                    print(f"  Height: {chrom.picked_peak['height'] if chrom.picked_peak else np.NaN:.2f}")
+            if valid.any():
+                chrom.picked_peak = chrom.peaks[int(np.argmax(np.where(valid, times, -np.inf)))]
+                if self._debug:
+                    self.logger.debug("Selected peak for %s", '-'.join(bb.name for bb in sequence if not bb.is_null))
+                    self.logger.debug("  Time: %.2f", chrom.picked_peak['time'])
+                    self.logger.debug("  Height: %.2f", chrom.picked_peak['height'])
             else:
                 chrom.picked_peak = None
 
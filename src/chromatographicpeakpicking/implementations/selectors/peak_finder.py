@@ -1,35 +1,32 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, Tuple
 import numpy as np
 from scipy.signal import find_peaks as sp_find_peaks
-import logging
-import sys
 
 from analyzers.peak_analyzer import PeakAnalyzer
 from configs.global_config import GlobalConfig
 from configs.peak_finder_config import PeakFinderConfig
 from core.chromatogram import Chromatogram
-from core.peak import Peak
+from core.peak_batch import PeakBatch
+from utilities.configure_logger import configure_logger
+from utilities.find_peaks_kernel import adaptive_find_peaks
 
 @dataclass
 class PeakFinder:
-    """Find peaks in chromatogram data using signal metrics for adaptive thresholds."""
+    """Find peaks in chromatogram data using signal metrics for adaptive thresholds.
+
+    Chromatograms are expected to carry time and signal data; callers validate this
+    once before peak finding. A chromatogram may set ``valid_start_idx`` to restrict the
+    search to the signal from that index onwards.
+    """
     config: PeakFinderConfig = field(default_factory=PeakFinderConfig)
     global_config: GlobalConfig = field(default_factory=GlobalConfig)
+    _peak_analyzer: PeakAnalyzer = field(default_factory=PeakAnalyzer, init=False, repr=False)
+    _grid_cache: Dict[Tuple[int, float, float], float] = field(default_factory=dict, init=False, repr=False)
 
     def __post_init__(self):
         """Initialize and configure logger for debug messages."""
-        self.logger = logging.getLogger(__name__)
-        if not self.logger.handlers:
-            console_handler = logging.StreamHandler(sys.stdout)
-            # Set base logging level based on global config
-            base_level = logging.DEBUG if self.global_config.debug else logging.INFO
-            console_handler.setLevel(base_level)
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
-            self.logger.setLevel(base_level)
-            self.logger.propagate = False
+        self.logger = configure_logger(__name__, self.global_config.debug)
 
     def _log_debug(self, message: str):
         """Helper method to only log debug messages if debug is enabled."""
@@ -39,10 +36,14 @@ class PeakFinder:
     def find_peaks(self, chrom: Chromatogram) -> Chromatogram:
         """Find peaks in chromatogram using adaptive thresholds based on signal metrics."""
         self._log_debug(f"Starting peak finding for chromatogram {id(chrom)}")
-        self._log_debug(f"Signal range: {np.min(chrom.y):.2f} to {np.max(chrom.y):.2f}")
+        self._log_debug(f"Signal range: {chrom['y_min']:.2f} to {chrom['y_max']:.2f}")
 
         # Calculate adaptive thresholds from metrics
         height_threshold = self._calculate_height_threshold(chrom)
+        if chrom['y_max'] < height_threshold:
+            self._log_debug("Signal never reaches the height threshold, skipping peak search")
+            return chrom
+
         prominence_threshold = self._calculate_prominence_threshold(chrom)
         width_threshold = self._calculate_width_threshold(chrom) * 0.01
         distance_threshold = 1
@@ -55,28 +56,53 @@ class PeakFinder:
         self._log_debug(f"  Distance: {distance_threshold}")
         self._log_debug(f"  Window length: {window_length}")
 
-        # Find peaks using scipy with adaptive parameters
-        peak_indices, peak_properties = sp_find_peaks(
-            chrom.y,
-            height=height_threshold,
-            prominence=prominence_threshold,
-            width=width_threshold,
-            distance=distance_threshold,
-            wlen=window_length,
-            rel_height=self.config.relative_height
-        )
+        # Only search the part of the signal the caller left open
+        start = getattr(chrom, 'valid_start_idx', 0)
+        y = chrom.y[start:] if start else chrom.y
+
+        # Find peaks with adaptive parameters, using the compiled kernel when available
+        if adaptive_find_peaks is not None:
+            peak_indices, peak_properties = adaptive_find_peaks(
+                y,
+                height_threshold,
+                prominence_threshold,
+                width_threshold,
+                window_length,
+                self.config.relative_height
+            )
+        else:
+            peak_indices, peak_properties = sp_find_peaks(
+                y,
+                height=height_threshold,
+                prominence=prominence_threshold,
+                width=width_threshold,
+                distance=distance_threshold,
+                wlen=window_length,
+                rel_height=self.config.relative_height
+            )
+
+        if start:
+            # Map positions in the searched slice back onto the full signal
+            peak_indices = peak_indices + start
+            for key in ('left_bases', 'right_bases', 'left_ips', 'right_ips'):
+                peak_properties[key] = peak_properties[key] + start
 
         self._log_debug(f"Found {len(peak_indices)} potential peaks")
         if len(peak_indices) > 0:
-            if chrom.y is None:
-                raise ValueError("Chromatogram must have signal data to find peaks.")
             self._log_debug("Peak heights found: " +
                         ", ".join([f"{chrom.y[idx]:.2f}" for idx in peak_indices]))
 
         peaks = self._create_peaks(chrom, peak_indices, peak_properties)
         self._log_debug(f"Created {len(peaks)} peak objects")
 
-        chrom.add_peaks(peaks)
+        # New peaks are appended to any already on the chromatogram, keeping the
+        # column layout instead of adding them row by row
+        if not chrom.peaks:
+            chrom.peaks = peaks
+        elif isinstance(chrom.peaks, PeakBatch):
+            chrom.peaks = PeakBatch.concatenate((chrom.peaks, peaks))
+        else:
+            chrom.add_peaks(peaks)
         return chrom
 
     def _calculate_height_threshold(self, chrom: Chromatogram) -> float:
@@ -104,11 +130,22 @@ class PeakFinder:
         self._log_debug(f"  Range-based: {range_based:.2f}")
         return threshold
 
+    def _sampling_rate(self, chrom: Chromatogram) -> float:
+        """Get the sampling interval of the chromatogram's time grid.
+
+        Chromatograms from one instrument share a time grid, so the value is
+        computed once per distinct grid and reused.
+        """
+        grid = (len(chrom.x), float(chrom.x[0]), float(chrom.x[-1]))
+        sampling_rate = self._grid_cache.get(grid)
+        if sampling_rate is None:
+            sampling_rate = (grid[2] - grid[1]) / grid[0]
+            self._grid_cache[grid] = sampling_rate
+        return sampling_rate
+
     def _calculate_width_threshold(self, chrom: Chromatogram) -> float:
         """Calculate adaptive width threshold."""
-        if chrom.x is None:
-            raise ValueError("Chromatogram must have time values to calculate width threshold.")
-        sampling_rate = (chrom.x[-1] - chrom.x[0]) / len(chrom.x)
+        sampling_rate = self._sampling_rate(chrom)
         roughness_factor = max(
             self.config.min_roughness_factor,
             min(chrom['baseline_roughness'] * self.config.roughness_scale,
@@ -128,9 +165,7 @@ class PeakFinder:
 
     def _calculate_window_length(self, chrom: Chromatogram) -> int:
         """Calculate window length for peak property calculations."""
-        if chrom.x is None:
-            raise ValueError("Chromatogram must have time values to calculate width threshold.")
-        sampling_rate = (chrom.x[-1] - chrom.x[0]) / len(chrom.x)
+        sampling_rate = self._sampling_rate(chrom)
         roughness_factor = max(
             self.config.min_window_roughness_factor,
             min(chrom['baseline_roughness'] * self.config.window_roughness_scale,
@@ -139,36 +174,25 @@ class PeakFinder:
         return max(int(roughness_factor / sampling_rate),
                   self.config.min_window_points)
 
-    def _create_peaks(self, chrom: Chromatogram, indices: np.ndarray, properties: dict) -> List[Peak]:
-        """Create Peak objects from scipy.find_peaks results."""
-        _peak_analyzer = PeakAnalyzer()
-        peaks = []
-        for i, idx in enumerate(indices):
-            peak = Peak()
-
-            if chrom.x is None:
-                raise ValueError("Chromatogram must have time values to calculate width threshold.")
-            peak['time'] = float(chrom.x[idx])
-            peak['index'] = int(idx)
-            peak['height'] = float(properties['peak_heights'][i])
-            peak['prominence'] = float(properties['prominences'][i])
-            peak['width'] = float(properties['widths'][i])
-            peak['width_5'] = float(properties['width_heights'][i])
-
-            left_base = int(properties['left_bases'][i])
-            right_base = int(properties['right_bases'][i])
-            peak['left_base_index'] = left_base
-            peak['right_base_index'] = right_base
-            peak['left_base_time'] = float(chrom.x[left_base])
-            peak['right_base_time'] = float(chrom.x[right_base])
-
-            peak = _peak_analyzer.analyze_peak(peak, chrom)
-            peaks.append(peak)
-
-            self._log_debug(f"Created peak at time {peak['time']:.2f}:")
-            self._log_debug(f"  Height: {peak['height']:.2f}")
-            self._log_debug(f"  Prominence: {peak['prominence']:.2f}")
-            self._log_debug(f"  Width: {peak['width']:.2f}")
+    def _create_peaks(self, chrom: Chromatogram, indices: np.ndarray, properties: dict) -> PeakBatch:
+        """Create a column-oriented batch of peaks from scipy.find_peaks results."""
+        peaks = PeakBatch.from_find_peaks(chrom.x, indices, properties)
+        for peak in peaks:
+            analyzed = self._peak_analyzer.analyze_peak(peak, chrom)
+            if analyzed is not peak:
+                # The analyzer returned new results rather than updating the row in place
+                peak.update(analyzed)
+
+        if self.global_config.debug:
+            # Format the per-peak details only when they will actually be logged
+            for time, height, prominence, width in zip(
+                peaks.time.tolist(), peaks.height.tolist(),
+                peaks.prominence.tolist(), peaks.width.tolist()
+            ):
+                self.logger.debug(f"Created peak at time {time:.2f}:")
+                self.logger.debug(f"  Height: {height:.2f}")
+                self.logger.debug(f"  Prominence: {prominence:.2f}")
+                self.logger.debug(f"  Width: {width:.2f}")
 
         return peaks
 
@@ -1,9 +1,8 @@
 # External imports
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-import logging
 import numpy as np
 from scipy.optimize import curve_fit
-import sys
 from typing import List, Union
 
 # Internal imports
@@ -12,9 +11,11 @@ from baseline_correctors.swm import SWM
 from configs.global_config import GlobalConfig
 from configs.sgppm_config import SGPPMConfig
 from core.chromatogram import Chromatogram
+from core.peak_batch import peak_column
 from peak_pickers.Ipeak_picker import IPeakPicker
 from peak_pickers.peak_finder import PeakFinder
-from utilities.gaussian_curve import gaussian_curve
+from utilities.configure_logger import configure_logger
+from utilities.gaussian_curve import gaussian_curve, gaussian_jacobian
 
 
 @dataclass
@@ -29,6 +30,8 @@ class SGPPM(
 
     Methods:
         pick_peaks: Process chromatograms to identify and select peaks
+        _process_chromatogram: Run the full picking sequence on a single chromatogram
+        _validate_chromatogram: Check that a chromatogram has signal data
         _fit_gaussians: Fit Gaussian curves to peaks in chromatogram
         _select_peak: Select the best peak based on height thresholds and Gaussian fit
     """
@@ -39,7 +42,7 @@ class SGPPM(
     def __post_init__(
         self
     ):
-        """Initialize and configure logger for debug messages.
+        """Initialize processing stages and configure logger for debug messages.
 
         Args:
             None
@@ -50,23 +53,12 @@ class SGPPM(
         Raise:
             None
         """
-        self.logger = logging.getLogger(__name__)
+        self.logger = configure_logger(__name__, self.global_config.debug)
 
-        if self.global_config.debug:
-            # Create console handler with a higher log level
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(logging.DEBUG)
-
-            # Create formatter and add it to the handler
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            console_handler.setFormatter(formatter)
-
-            # Add the handler to the logger
-            self.logger.addHandler(console_handler)
-            self.logger.setLevel(logging.DEBUG)
-
-            # Prevent logger from propagating to root logger
-            self.logger.propagate = False
+        # Stages are shared by every chromatogram processed by this picker
+        self._analyzer = ChromatogramAnalyzer()
+        self._swm = SWM()
+        self._peak_finder = PeakFinder()
 
 
     def pick_peaks(
@@ -91,38 +83,84 @@ class SGPPM(
         if isinstance(chromatograms, Chromatogram):
             chromatograms = [chromatograms]
 
-        analyzer = ChromatogramAnalyzer()
-        swm = SWM()
-        peak_finder = PeakFinder()
+        for chrom in chromatograms:
+            self._validate_chromatogram(chrom)
+
+        if self.config.max_workers == 1 or len(chromatograms) <= self.config.chunksize:
+            # A batch that fits in one chunk would go to a single worker anyway, so it
+            # is not worth starting a pool and pickling the chromatograms both ways
+            chromatograms = [self._process_chromatogram(chrom) for chrom in chromatograms]
+        else:
+            # Chromatograms are independent, so spread them over worker processes
+            with ProcessPoolExecutor(max_workers=self.config.max_workers) as executor:
+                chromatograms = list(executor.map(
+                    self._process_chromatogram,
+                    chromatograms,
+                    chunksize=self.config.chunksize
+                ))
 
-        for i, chrom in enumerate(chromatograms):
-            if self.global_config.debug:
-                if chrom.y is None or chrom.x is None:
-                    raise ValueError("Chromatogram contains no signal data")
-                self.logger.debug(f"Processing chromatogram {i+1}/{len(chromatograms)} (id={id(chrom)})")
-                self.logger.debug(f"Initial data shape: ({len(chrom.x)}, {len(chrom.y)})")
+        return chromatograms[0] if len(chromatograms) == 1 else chromatograms
 
-            chrom = analyzer(chrom)
-            if self.global_config.debug:
-                self.logger.debug("Completed chromatogram analysis")
 
-            chrom = swm(chrom)
-            if self.global_config.debug:
-                self.logger.debug("Completed baseline correction")
+    def _process_chromatogram(
+        self,
+        chrom: Chromatogram
+    ) -> Chromatogram:
+        """Run analysis, baseline correction, peak finding, fitting and selection on one chromatogram.
 
-            chrom = peak_finder(chrom)
-            if self.global_config.debug:
-                self.logger.debug(f"Found {len(chrom.peaks)} initial peaks")
+        Args:
+            chrom (Chromatogram): Chromatogram to process
 
-            chrom = self._fit_gaussians(chrom)
-            if self.global_config.debug:
-                self.logger.debug("Completed Gaussian fitting")
+        Returns:
+            Chromatogram: Processed chromatogram
 
-            chrom = self._select_peak(chrom)
-            if self.global_config.debug:
-                self.logger.debug(f"Selected {len(chrom.peaks)} final peaks")
+        Raises:
+            None
+        """
+        if self.global_config.debug:
+            self.logger.debug(f"Processing chromatogram (id={id(chrom)})")
+            self.logger.debug(f"Initial data shape: ({len(chrom.x)}, {len(chrom.y)})")
 
-        return chromatograms[0] if len(chromatograms) == 1 else chromatograms
+        chrom = self._analyzer(chrom)
+        if self.global_config.debug:
+            self.logger.debug("Completed chromatogram analysis")
+
+        chrom = self._swm(chrom)
+        if self.global_config.debug:
+            self.logger.debug("Completed baseline correction")
+
+        chrom = self._peak_finder(chrom)
+        if self.global_config.debug:
+            self.logger.debug(f"Found {len(chrom.peaks)} initial peaks")
+
+        chrom = self._fit_gaussians(chrom)
+        if self.global_config.debug:
+            self.logger.debug("Completed Gaussian fitting")
+
+        chrom = self._select_peak(chrom)
+        if self.global_config.debug:
+            self.logger.debug(f"Selected {len(chrom.peaks)} final peaks")
+
+        return chrom
+
+
+    def _validate_chromatogram(
+        self,
+        chrom: Chromatogram
+    ) -> None:
+        """Check that a chromatogram carries the data every processing stage relies on.
+
+        Args:
+            chrom (Chromatogram): Chromatogram to validate
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If chromatogram contains no signal data
+        """
+        if chrom.x is None or chrom.y is None:
+            raise ValueError("Chromatogram contains no signal data")
 
 
     def _fit_gaussians(
@@ -146,17 +184,25 @@ class SGPPM(
         peaks = chrom.peaks
         x = chrom.x
         y = chrom.y
+        # Check the data for NaN/inf once here rather than in every fit
+        data_is_finite = bool(np.isfinite(x).all() and np.isfinite(y).all())
+        # Starting guesses come straight from the peak columns
+        times = peak_column(peaks, 'time')
+        heights = peak_column(peaks, 'height')
 
         for i, peak in enumerate(peaks):
-            if self.global_config.debug:
-                self.logger.debug(f"Fitting peak {i+1}/{len(peaks)} at time {peak['time']:.2f}")
+            peak_x = times.item(i)
+            peak_y = heights.item(i)
 
-            peak_x = peak['time']
-            peak_y = peak['height']
+            if self.global_config.debug:
+                self.logger.debug(f"Fitting peak {i+1}/{len(peaks)} at time {peak_x:.2f}")
 
             try:
                 # Fit the gaussian curve
-                popt, pcov = curve_fit(gaussian_curve, x, y, p0=[peak_y, peak_x, 1])
+                popt, pcov = curve_fit(
+                    gaussian_curve, x, y, p0=[peak_y, peak_x, 1],
+                    jac=gaussian_jacobian, check_finite=not data_is_finite
+                )
 
                 if self.global_config.debug:
                     self.logger.debug(f"Gaussian fit parameters - Height: {popt[0]:.2f}, Center: {popt[1]:.2f}, Width: {popt[2]:.2f}")
@@ -205,31 +251,28 @@ class SGPPM(
             return chrom
 
         # Get maximum signal intensity
-        max_y = np.max(chrom.y)
+        max_y = chrom['y_max']
         if self.global_config.debug:
             self.logger.debug(f"Maximum signal intensity: {max_y:.2f}")
 
-        # Filter peaks based on thresholds
-        valid_peaks = []
-        for i, peak in enumerate(chrom.peaks):
-            peak_height = peak['height']
-            is_valid = (peak_height >= self.config.height_threshold and
-                       peak_height >= max_y * self.config.pick_rel_height)
+        # Filter peaks based on thresholds in a single vectorized comparison; a
+        # PeakBatch supplies its height column without any per-peak reads
+        heights = peak_column(chrom.peaks, 'height')
+        threshold = max(self.config.height_threshold, max_y * self.config.pick_rel_height)
+        valid_idx = np.flatnonzero(heights >= threshold)
 
-            if self.global_config.debug:
-                self.logger.debug(f"Peak {i+1} - Height: {peak_height:.2f}, Valid: {is_valid}")
-
-            if is_valid:
-                valid_peaks.append(peak)
+        if self.global_config.debug:
+            for i, peak_height in enumerate(heights):
+                self.logger.debug(f"Peak {i+1} - Height: {peak_height:.2f}, Valid: {peak_height >= threshold}")
 
         # Return if no valid peaks found
-        if not valid_peaks:
+        if valid_idx.size == 0:
             if self.global_config.debug:
                 self.logger.debug("No peaks meet threshold criteria")
             return chrom
 
         # Select peak with highest intensity
-        best_peak = max(valid_peaks, key=lambda p: p['time'])
+        best_peak = chrom.peaks[int(valid_idx[np.argmax(heights[valid_idx])])]
         if self.global_config.debug:
             self.logger.debug(f"Selected best peak - Height: {best_peak['height']:.2f}, Time: {best_peak['time']:.2f}")
 
@@ -1,14 +1,26 @@
 # External imports
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+from matplotlib.axes import Axes
 import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
 from matplotlib.figure import Figure
 import numpy as np
 
 # Internal imports
 from configs.chromatogram_visualizer_config import ChromatogramVisualizerConfig
 from core.chromatogram import Chromatogram
+from core.peak_batch import PeakBatch
+from visualizers.image_type import ImageType
+from visualizers.output_paths import compound_name, output_paths
 from visualizers.Ivisualizer import IVisualizer
 
+# PNG compression dominates batch save time; favour speed over file size
+_SAVE_KWARGS = {
+    ImageType.PNG: {'pil_kwargs': {'compress_level': 1}},
+}
 
 @dataclass
 class ChromatogramVisualizer(
@@ -18,12 +30,17 @@ class ChromatogramVisualizer(
 
     Attributes:
         config (ChromatogramVisualizerConfig): Configuration for the visualizer
+        max_peak_annotations (Optional[int]): Largest number of peaks that are individually
+            annotated, or None to annotate every peak
 
     Methods:
         visualize: Generate a visualization of a chromatogram
-        save: Save a figure to a file
+        visualize_many: Render many chromatograms to image files on one reused figure
+        render_batch: Render many chromatograms to image files in parallel processes
+        save: Save a figure to a file and close it
     """
     config: ChromatogramVisualizerConfig = field(default_factory=ChromatogramVisualizerConfig)
+    max_peak_annotations: Optional[int] = None
 
     def visualize(
         self,
@@ -39,10 +56,171 @@ class ChromatogramVisualizer(
         Raises:
             None
         """
-        # Apply style configuration
-        plt.rcParams.update(self.config.rcParamas)
-        # Create figure and axis
-        fig, ax = plt.subplots(figsize=(12, 6))
+        # Apply style configuration to this figure only; rc_context restores the
+        # global rcParams on exit instead of mutating them on every call
+        with plt.rc_context(self.config.rcParamas):
+            # Create figure and axis
+            fig, ax = plt.subplots(figsize=(12, 6))
+            self._draw(ax, chrom)
+            # Adjust layout to prevent label clipping
+            fig.tight_layout()
+        return fig
+
+    def visualize_many(
+        self,
+        chroms: Iterable[Chromatogram],
+        out_dir: Union[str, Path],
+        image_type: ImageType = ImageType.PNG
+    ) -> List[Path]:
+        """Render chromatograms to image files, reusing a single figure.
+
+        The axes are cleared between chromatograms instead of creating and tearing down
+        a figure for each one. Files are named after the compound followed by the position
+        of the chromatogram, so chromatograms of the same compound do not overwrite each
+        other; the position alone is used when the building blocks are unknown.
+
+        Args:
+            chroms: Chromatogram objects to render
+            out_dir: Directory in which to write the images
+            image_type: Image format to write
+
+        Returns:
+            List[Path]: Paths of the written images, in input order
+
+        Raises:
+            None
+        """
+        chroms = list(chroms)
+        paths = output_paths(chroms, out_dir, image_type)
+        self._render(chroms, paths, image_type)
+        return paths
+
+    def render_batch(
+        self,
+        chroms: Iterable[Chromatogram],
+        out_dir: Union[str, Path],
+        image_type: ImageType = ImageType.PNG,
+        workers: int = 1
+    ) -> List[Path]:
+        """Render chromatograms to image files, optionally in parallel worker processes.
+
+        Chromatograms are split into one contiguous chunk per worker, and each worker
+        renders its chunk on a single reused figure as visualize_many does. Processes
+        are used rather than threads because rendering holds the GIL and Matplotlib
+        style state is global. Files are named as in visualize_many.
+
+        Worker processes are opt-in: starting them and pickling the chromatograms only
+        pays off for large batches, and on platforms that spawn workers the calling
+        script must guard its entry point with ``if __name__ == '__main__':``.
+
+        Args:
+            chroms: Chromatogram objects to render; they must be picklable
+            out_dir: Directory in which to write the images
+            image_type: Image format to write
+            workers: Number of worker processes; 1 renders in this process
+
+        Returns:
+            List[Path]: Paths of the written images, in input order
+
+        Raises:
+            ValueError: If two chromatograms would be written to the same path
+        """
+        chroms = list(chroms)
+        # Paths are fixed and checked for uniqueness before any job is submitted
+        paths = output_paths(chroms, out_dir, image_type)
+        n_workers = min(workers, len(chroms))
+        if n_workers <= 1:
+            self._render(chroms, paths, image_type)
+            return paths
+        chunk_size = -(-len(chroms) // n_workers)
+        with ProcessPoolExecutor(n_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._render,
+                    chroms[start:start + chunk_size],
+                    paths[start:start + chunk_size],
+                    image_type
+                )
+                for start in range(0, len(chroms), chunk_size)
+            ]
+            for future in futures:
+                # Re-raise any rendering error from the worker
+                future.result()
+        return paths
+
+    def _render(
+        self,
+        chroms: List[Chromatogram],
+        paths: List[Path],
+        image_type: ImageType
+    ) -> None:
+        """Render chromatograms to the given files on one reused figure.
+
+        Args:
+            chroms: Chromatogram objects to render
+            paths: File to write for each chromatogram
+            image_type: Image format to write
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        with plt.rc_context(self.config.rcParamas):
+            # The figure is only ever saved, so it is built without pyplot: no GUI
+            # backend is involved and nothing is registered that must be closed later
+            fig = Figure(figsize=(12, 6))
+            ax = fig.add_subplot()
+            for chrom, path in zip(chroms, paths):
+                ax.cla()
+                self._draw(ax, chrom)
+                fig.tight_layout()
+                fig.savefig(path, format=image_type, **_SAVE_KWARGS.get(image_type, {}))
+
+    def save(
+        self,
+        fig: Figure,
+        path: Union[str, Path],
+        image_type: ImageType = ImageType.PNG
+    ) -> Path:
+        """Save a figure to a file and close it.
+
+        Args:
+            fig: Figure to save, typically returned by visualize
+            path: File to write
+            image_type: Image format to write
+
+        Returns:
+            Path: Path of the written image
+
+        Raises:
+            None
+        """
+        path = Path(path)
+        with plt.rc_context(self.config.rcParamas):
+            fig.savefig(path, format=image_type, **_SAVE_KWARGS.get(image_type, {}))
+        # Release the figure so pyplot does not keep every rendered figure alive
+        plt.close(fig)
+        return path
+
+    def _draw(
+        self,
+        ax: Axes,
+        chrom: Chromatogram
+    ) -> None:
+        """Draw a chromatogram with its peaks and annotations onto an axis.
+
+        Args:
+            ax: Axis to draw on
+            chrom: Chromatogram object to draw
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
         # Plot base chromatogram
         ax.plot(
             chrom.x,
@@ -53,52 +231,60 @@ class ChromatogramVisualizer(
         )
         # Plot all detected peaks and add annotations
         if chrom.peaks:
-            peak_times = []
-            peak_heights = []
-            for peak in chrom.peaks:
-                peak_times.append(peak['time'])
-                peak_heights.append(peak['height'])
-
-                # Add shaded area under the peak
-                peak_slice = slice(peak['left_base_index'], peak['right_base_index'] + 1)
-                ax.fill_between(
-                    chrom.x[peak_slice],
-                    chrom.y[peak_slice],
-                    alpha=0.3,
-                    hatch='///',
-                    color='tab:orange' if peak is not chrom.picked_peak else 'tab:green'
-                )
+            peaks = chrom.peaks
+            n_peaks = len(peaks)
+            peak_times, peak_heights, left_bases, right_bases = self._peak_columns(peaks)
+            is_picked = np.fromiter(
+                (peak is chrom.picked_peak for peak in peaks), bool, count=n_peaks
+            )
+            colors = np.where(is_picked, 'tab:green', 'tab:orange')
 
-                # Plot peak without label to avoid legend duplication
-                ax.plot(
-                    peak['time'],
-                    peak['height'],
-                    color='tab:orange',
-                    marker='.',
-                    markersize=8,
-                    zorder=5
-                )
-                if peak is chrom.picked_peak:
+            # Add shaded areas under all peaks as a single collection
+            polygons = []
+            polygon_colors = []
+            for left, right, color in zip(left_bases.tolist(), right_bases.tolist(), colors):
+                x_fill = chrom.x[left:right + 1]
+                if x_fill.size == 0:
                     continue
-                # Add annotation for each peak
-                ax.annotate(
-                    f'{peak["time"]:.1f}\nArea: {peak["area"]:.1f}',
-                    xy=(peak['time'], peak['height']),
-                    xytext=(0, 20),
-                    textcoords='offset points',
-                    ha='center',
-                    va='top',
-                    fontsize=10,
-                    color='tab:orange'
-                )
-            # Add a single legend entry for all detected peaks
+                y_fill = chrom.y[left:right + 1]
+                polygons.append(np.column_stack((
+                    np.concatenate(([x_fill[0]], x_fill, [x_fill[-1]])),
+                    np.concatenate(([0.0], y_fill, [0.0]))
+                )))
+                polygon_colors.append(color)
+            ax.add_collection(PolyCollection(
+                polygons,
+                facecolors=polygon_colors,
+                edgecolors=polygon_colors,
+                alpha=0.3,
+                hatch='///'
+            ))
+
+            # Plot all peaks in one call, carrying the legend entry for detected peaks
             ax.scatter(
-                [],
-                [],
+                peak_times,
+                peak_heights,
                 color='tab:orange',
+                marker='.',
+                s=64,
+                zorder=5,
                 label='Detected Peaks'
             )
 
+            # Add annotation for each peak, unless capped to keep dense plots readable
+            if self.max_peak_annotations is None or n_peaks <= self.max_peak_annotations:
+                for row in np.flatnonzero(~is_picked).tolist():
+                    ax.annotate(
+                        f'{peak_times[row]:.1f}\nArea: {peaks[row]["area"]:.1f}',
+                        xy=(peak_times[row], peak_heights[row]),
+                        xytext=(0, 20),
+                        textcoords='offset points',
+                        ha='center',
+                        va='top',
+                        fontsize=10,
+                        color='tab:orange'
+                    )
+
         # Highlight picked peak
         if chrom.picked_peak is not None:
             ax.scatter(
@@ -130,14 +316,12 @@ class ChromatogramVisualizer(
                 weight='bold'
             )
         # Set title with building block information
-        bb_names = [
-            bb.name for bb in chrom.building_blocks if bb is not None
-        ] if chrom.building_blocks is not None else None
+        name = compound_name(chrom)
         ax.set_title(
-            f"Chromatogram: {'_'.join(bb_names[::-1])}") \
-                if bb_names is not None \
-                else ax.set_title("Chromatogram: Unknown Compound"
-                )
+            f"Chromatogram: {name}"
+            if name is not None
+            else "Chromatogram: Unknown Compound"
+        )
         # Set labels and grid
         ax.set_xlabel("Time (min)")
         ax.set_ylabel("Intensity")
@@ -147,13 +331,65 @@ class ChromatogramVisualizer(
             ax.set_xlim([chrom.x[0], chrom.x[-1]])
         # Set y limits: 0 to nearest hundred above max
         if chrom.y is not None:
-            max_y = np.max(chrom.y)
+            max_y = self._signal_max(chrom)
             upper_limit = np.ceil(max_y / 100) * 100
             # Add extra space for annotations
             ax.set_ylim([0, upper_limit * 1.1])
         # Add legend if we have any labeled elements
         if ax.get_legend_handles_labels()[0]:
             ax.legend()
-        # Adjust layout to prevent label clipping
-        fig.tight_layout()
-        return fig
+
+    @staticmethod
+    def _signal_max(
+        chrom: Chromatogram
+    ) -> float:
+        """Get the largest intensity of a chromatogram.
+
+        The range metric cached by the chromatogram analyzer is used when present, so the
+        signal is only rescanned for chromatograms that have not been analyzed.
+
+        Args:
+            chrom: Chromatogram object to measure
+
+        Returns:
+            float: Maximum intensity of the signal
+
+        Raises:
+            None
+        """
+        try:
+            max_y = chrom['y_max']
+        except (KeyError, TypeError):
+            max_y = None
+        if max_y is None:
+            max_y = np.max(chrom.y)
+        return float(max_y)
+
+    @staticmethod
+    def _peak_columns(
+        peaks
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get the peak times, heights and base indices as parallel arrays.
+
+        A PeakBatch already stores its peaks column-wise, so its arrays are used directly;
+        any other sequence of dictionary-style peaks is gathered into new arrays.
+
+        Args:
+            peaks: Detected peaks of a chromatogram
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Times, heights, left
+                base indices and right base indices of the peaks
+
+        Raises:
+            None
+        """
+        if isinstance(peaks, PeakBatch):
+            return peaks.time, peaks.height, peaks.left_base_index, peaks.right_base_index
+        n_peaks = len(peaks)
+        return (
+            np.fromiter((peak['time'] for peak in peaks), float, count=n_peaks),
+            np.fromiter((peak['height'] for peak in peaks), float, count=n_peaks),
+            np.fromiter((peak['left_base_index'] for peak in peaks), np.intp, count=n_peaks),
+            np.fromiter((peak['right_base_index'] for peak in peaks), np.intp, count=n_peaks)
+        )
@@ -2,17 +2,24 @@
 from enum import Enum
 
 
-class ImageType(Enum):
+class ImageType(str, Enum):
     """Enum class for image types
 
+    Members are strings, so they can be used directly as file extensions or as the
+    format argument of savefig.
+
     Attributes:
         PDF (str): PDF image type
         PNG (str): PNG image type
         SVG (str): SVG image type
 
     Methods:
-        None
+        __str__: Get the file extension of the image type
     """
     PDF = 'pdf'
     PNG = 'png'
     SVG = 'svg'
+
+    def __str__(self) -> str:
+        # Format as the bare extension on every Python version
+        return self.value
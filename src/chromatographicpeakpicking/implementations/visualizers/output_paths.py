@@ -0,0 +1,58 @@
+# External imports
+import re
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+# Characters kept in output file names; anything else is replaced by '_'
+_UNSAFE_NAME_CHARS = re.compile(r'[^A-Za-z0-9._-]+')
+
+
+def compound_name(
+    chrom
+) -> Optional[str]:
+    """Build the compound name from a chromatogram's building blocks.
+
+    Args:
+        chrom: Chromatogram object to name
+
+    Returns:
+        Optional[str]: Building block names in reverse order joined by '_', or None if unknown
+
+    Raises:
+        None
+    """
+    if chrom.building_blocks is None:
+        return None
+    return '_'.join(bb.name for bb in reversed(chrom.building_blocks) if bb is not None)
+
+
+def output_paths(
+    chroms: Sequence,
+    out_dir: Union[str, Path],
+    extension: str
+) -> List[Path]:
+    """Name the image file of each chromatogram.
+
+    The compound name is reduced to characters that are safe in a file name, and the
+    position of the chromatogram is always appended so that every name is unique.
+
+    Args:
+        chroms: Chromatogram objects to name
+        out_dir: Directory in which the images are written
+        extension: File extension of the images, without the dot
+
+    Returns:
+        List[Path]: One path per chromatogram, in input order
+
+    Raises:
+        ValueError: If two chromatograms would be written to the same path
+    """
+    out_dir = Path(out_dir)
+    paths = []
+    for index, chrom in enumerate(chroms):
+        name = _UNSAFE_NAME_CHARS.sub('_', compound_name(chrom) or '') or 'chromatogram'
+        paths.append(out_dir / f"{name}_{index}.{extension}")
+    # Worker processes write independently, so a shared path would be silently overwritten
+    if len(set(paths)) != len(paths):
+        raise ValueError("Output paths of the rendered chromatograms are not unique")
+    return paths
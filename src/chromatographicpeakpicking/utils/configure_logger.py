@@ -0,0 +1,36 @@
+# src/chromatographicpeakpicking/utils/configure_logger.py
+
+"""
+Shared console logger setup for peak picking components.
+"""
+import logging
+import sys
+
+def configure_logger(name: str, debug: bool) -> logging.Logger:
+    """Get a console logger, attaching its handler only once.
+
+    Repeated calls for the same name reuse the existing handler, so constructing
+    many components never duplicates log lines. The level is set when the logger is
+    first configured; later calls may only enable debug messages, never silence them,
+    so a non-debug component cannot switch off debug output for another component
+    sharing the logger. Components gate their own debug output on their debug flag.
+
+    Args:
+        name (str): Name of the logger
+        debug (bool): Whether debug messages should be emitted
+
+    Returns:
+        logging.Logger: The configured logger
+    """
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        console_handler = logging.StreamHandler(sys.stdout)
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        console_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
+        # Prevent logger from propagating to root logger
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG if debug else logging.INFO)
+    elif debug and not logger.isEnabledFor(logging.DEBUG):
+        logger.setLevel(logging.DEBUG)
+    return logger
@@ -0,0 +1,159 @@
+# src/chromatographicpeakpicking/utils/find_peaks_kernel.py
+
+"""
+Compiled peak detection for the fixed parameter set used by PeakFinder.
+
+``scipy.signal.find_peaks`` validates and dispatches every optional argument on each
+call, which dominates the cost on short chromatograms. This module reproduces its
+results for minimum height, prominence and width thresholds with a window length in
+a single Numba kernel. When Numba is not installed ``adaptive_find_peaks`` is ``None``
+and callers should fall back to SciPy.
+"""
+import math
+from typing import Dict, Tuple
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    njit = None
+
+
+def _find_peaks_kernel(y, height, prominence, width, wlen, rel_height):
+    n = y.shape[0]
+
+    # Local maxima; flat peaks resolve to the middle sample as in SciPy
+    maxima = np.empty(n // 2 + 1, dtype=np.intp)
+    count = 0
+    i = 1
+    i_max = n - 1
+    while i < i_max:
+        if y[i - 1] < y[i]:
+            i_ahead = i + 1
+            while i_ahead < i_max and y[i_ahead] == y[i]:
+                i_ahead += 1
+            if y[i_ahead] < y[i]:
+                maxima[count] = (i + i_ahead - 1) // 2
+                count += 1
+                i = i_ahead
+        i += 1
+
+    peaks = np.empty(count, dtype=np.intp)
+    prominences = np.empty(count, dtype=np.float64)
+    left_bases = np.empty(count, dtype=np.intp)
+    right_bases = np.empty(count, dtype=np.intp)
+    width_heights = np.empty(count, dtype=np.float64)
+    left_ips = np.empty(count, dtype=np.float64)
+    right_ips = np.empty(count, dtype=np.float64)
+    widths = np.empty(count, dtype=np.float64)
+
+    kept = 0
+    for k in range(count):
+        peak = maxima[k]
+        if y[peak] < height:
+            continue
+
+        # Prominence: lowest point on each side before a higher sample or the window edge
+        lo = 0
+        hi = n - 1
+        if wlen >= 2:
+            lo = max(peak - wlen // 2, lo)
+            hi = min(peak + wlen // 2, hi)
+        left_base = peak
+        left_min = y[peak]
+        i = peak
+        while lo <= i and y[i] <= y[peak]:
+            if y[i] < left_min:
+                left_min = y[i]
+                left_base = i
+            i -= 1
+        right_base = peak
+        right_min = y[peak]
+        i = peak
+        while i <= hi and y[i] <= y[peak]:
+            if y[i] < right_min:
+                right_min = y[i]
+                right_base = i
+            i += 1
+        peak_prominence = y[peak] - max(left_min, right_min)
+        if peak_prominence < prominence:
+            continue
+
+        # Width at rel_height of the prominence, interpolated between samples
+        eval_height = y[peak] - peak_prominence * rel_height
+        i = peak
+        while left_base < i and eval_height < y[i]:
+            i -= 1
+        left_ip = float(i)
+        if y[i] < eval_height:
+            left_ip += (eval_height - y[i]) / (y[i + 1] - y[i])
+        i = peak
+        while i < right_base and eval_height < y[i]:
+            i += 1
+        right_ip = float(i)
+        if y[i] < eval_height:
+            right_ip -= (eval_height - y[i]) / (y[i - 1] - y[i])
+        peak_width = right_ip - left_ip
+        if peak_width < width:
+            continue
+
+        peaks[kept] = peak
+        prominences[kept] = peak_prominence
+        left_bases[kept] = left_base
+        right_bases[kept] = right_base
+        width_heights[kept] = eval_height
+        left_ips[kept] = left_ip
+        right_ips[kept] = right_ip
+        widths[kept] = peak_width
+        kept += 1
+
+    return (
+        peaks[:kept], prominences[:kept], left_bases[:kept], right_bases[:kept],
+        width_heights[:kept], left_ips[:kept], right_ips[:kept], widths[:kept]
+    )
+
+
+_compiled_kernel = njit(cache=True)(_find_peaks_kernel) if njit is not None else None
+
+
+def _adaptive_find_peaks(
+    y: np.ndarray,
+    height: float,
+    prominence: float,
+    width: float,
+    wlen: float,
+    rel_height: float
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Find peaks with minimum height, prominence and width thresholds.
+
+    Args:
+        y (np.ndarray): Signal to search
+        height (float): Minimum peak height
+        prominence (float): Minimum peak prominence
+        width (float): Minimum peak width in samples
+        wlen (float): Window length used for prominence calculation
+        rel_height (float): Relative height at which widths are measured
+
+    Returns:
+        Tuple[np.ndarray, Dict[str, np.ndarray]]: Peak indices and properties, keyed as
+        returned by ``scipy.signal.find_peaks``
+    """
+    wlen = math.ceil(wlen) if wlen is not None and wlen > 1 else -1
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    (peaks, prominences, left_bases, right_bases,
+     width_heights, left_ips, right_ips, widths) = _compiled_kernel(
+        y, float(height), float(prominence), float(width), int(wlen), float(rel_height)
+    )
+    return peaks, {
+        'peak_heights': y[peaks],
+        'prominences': prominences,
+        'left_bases': left_bases,
+        'right_bases': right_bases,
+        'width_heights': width_heights,
+        'left_ips': left_ips,
+        'right_ips': right_ips,
+        'widths': widths,
+    }
+
+
+adaptive_find_peaks = _adaptive_find_peaks if _compiled_kernel is not None else None
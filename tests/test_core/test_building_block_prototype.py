@@ -0,0 +1,12 @@
+# tests/test_core/test_building_block_prototype.py
+import pytest
+from src.chromatographicpeakpicking.core.prototypes.building_block import BuildingBlock
+
+def test_building_block_is_null():
+    assert BuildingBlock(name="Null").is_null
+    assert not BuildingBlock(name="TestBlock").is_null
+
+def test_building_block_clone_updates_is_null():
+    block = BuildingBlock(name="TestBlock")
+    assert block.clone(name="Null").is_null
+    assert not BuildingBlock(name="Null").clone(name="TestBlock").is_null
@@ -0,0 +1,34 @@
+# tests/test_core/test_peak_batch.py
+import numpy as np
+import pytest
+from src.chromatographicpeakpicking.core.prototypes.peak_batch import PeakBatch
+
+def make_batch(indices):
+    x = np.linspace(0, 10, 101)
+    indices = np.asarray(indices)
+    properties = {
+        'peak_heights': indices * 1.0,
+        'prominences': indices * 0.5,
+        'widths': np.ones(len(indices)),
+        'width_heights': np.ones(len(indices)),
+        'left_bases': indices - 1,
+        'right_bases': indices + 1,
+    }
+    return PeakBatch.from_find_peaks(x, indices, properties)
+
+def test_peak_view_writes_columns_and_extras():
+    batch = make_batch([10, 20])
+    batch[0]['height'] = 7.0
+    batch[0]['area'] = 3.0
+    assert batch.height[0] == 7.0
+    assert batch[0]['area'] == 3.0
+    with pytest.raises(KeyError):
+        batch[1]['area']
+
+def test_concatenate_appends_rows_and_extras():
+    first, second = make_batch([10, 20]), make_batch([30])
+    first[1]['area'] = 1.0
+    second[0]['area'] = 2.0
+    batch = PeakBatch.concatenate((first, second))
+    assert batch.index.tolist() == [10, 20, 30]
+    assert [peak.get('area') for peak in batch] == [None, 1.0, 2.0]
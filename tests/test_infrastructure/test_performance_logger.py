@@ -1,7 +1,7 @@
 # tests/test_infrastructure/test_performance_logger.py
 
 import pytest
-from src.chromatographicpeakpicking.infrastructure.logging.performance_logger import PerformanceLogger
+from src.chromatographicpeakpicking.implementations.infrastructure.logging.performance_logger import PerformanceLogger
 
 def test_performance_logger_initialization():
     logger = PerformanceLogger()
@@ -12,3 +12,19 @@ def test_performance_logger_log_operation():
     logger.log_operation("test_operation", 1.23)
     assert len(logger.get_operation_history()) == 1
     assert logger.get_operation_history()[0] == ("test_operation", 1.23)
+
+def test_performance_logger_average_duration():
+    logger = PerformanceLogger()
+    logger.log_operation("load", 1.0)
+    logger.log_operation("fit", 4.0)
+    logger.log_operation("load", 3.0)
+    assert logger.get_average_duration("load") == 2.0
+    assert logger.get_average_duration("missing") == 0.0
+    assert list(logger.get_operation_history("load")) == [("load", 1.0), ("load", 3.0)]
+
+def test_performance_logger_bounded_history():
+    logger = PerformanceLogger(max_history=2)
+    for duration in (1.0, 2.0, 3.0):
+        logger.log_operation("load", duration)
+    assert list(logger.get_operation_history()) == [("load", 2.0), ("load", 3.0)]
+    assert logger.get_average_duration("load") == 2.0
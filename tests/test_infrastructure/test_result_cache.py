@@ -1,7 +1,7 @@
 # tests/test_infrastructure/test_result_cache.py
 
 import pytest
-from src.chromatographicpeakpicking.infrastructure.caching.result_cache import ResultCache
+from src.chromatographicpeakpicking.implementations.infrastructure.caching.result_cache import ResultCache
 
 def test_result_cache_initialization():
     cache = ResultCache()
@@ -17,3 +17,27 @@ def test_result_cache_invalidate():
     cache.set("key1", "value1")
     cache.invalidate("key1")
     assert cache.get("key1") is None
+
+def test_result_cache_evicts_least_recently_used():
+    cache = ResultCache(max_entries=2)
+    cache.set("key1", "value1")
+    cache.set("key2", "value2")
+    cache.get("key1")
+    cache.set("key3", "value3")
+    assert cache.get("key1") == "value1"
+    assert cache.get("key2") is None
+    assert cache.get("key3") == "value3"
+
+def test_result_cache_memoize():
+    cache = ResultCache()
+    calls = []
+
+    @cache.memoize
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert square(3) == 9
+    assert square(3) == 9
+    assert square(4) == 16
+    assert calls == [3, 4]
@@ -0,0 +1,37 @@
+# tests/test_io/test_csv_format.py
+import asyncio
+
+import pandas as pd
+import pytest
+from src.chromatographicpeakpicking.implementations.io.formats.csv_format import CSVFormatHandler
+
+CSV_TEXT = (
+    "sample,date,acquired,intensity,count\n"
+    "a,2024-01-05,2024-01-05 10:00,1.5,3\n"
+    "b,2024-02-05,2024-02-05T11:30:00,2.5,\n"
+)
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(CSV_TEXT)
+    return path
+
+def test_csv_read_matches_c_engine_records(csv_path):
+    result = asyncio.run(CSVFormatHandler().read(csv_path))
+    expected = pd.read_csv(csv_path, engine='c')
+    assert result['columns'] == list(expected.columns)
+    # NaN never compares equal, so the records are compared as frames
+    pd.testing.assert_frame_equal(pd.DataFrame(result['data']), expected)
+
+def test_csv_read_keeps_date_columns_as_strings(csv_path):
+    records = asyncio.run(CSVFormatHandler().read(csv_path))['data']
+    assert records[0]['date'] == "2024-01-05"
+    assert records[1]['acquired'] == "2024-02-05T11:30:00"
+
+def test_csv_read_differs_from_pyarrow_engine_on_dates(csv_path):
+    pytest.importorskip("pyarrow")
+    records = asyncio.run(CSVFormatHandler().read(csv_path))['data']
+    pyarrow_records = pd.read_csv(csv_path, engine='pyarrow').to_dict('records')
+    assert [type(row['date']) for row in records] == [str, str]
+    assert [type(row['date']) for row in pyarrow_records] != [str, str]
@@ -0,0 +1,25 @@
+# tests/test_visualizers/test_output_paths.py
+from types import SimpleNamespace
+
+from src.chromatographicpeakpicking.implementations.visualizers.output_paths import compound_name, output_paths
+
+def make_chromatogram(*names):
+    return SimpleNamespace(
+        building_blocks=[SimpleNamespace(name=name) for name in names] if names else None
+    )
+
+def test_compound_name():
+    assert compound_name(make_chromatogram("A", "B")) == "B_A"
+    assert compound_name(make_chromatogram()) is None
+
+def test_output_paths_unique_for_duplicate_compounds(tmp_path):
+    chroms = [make_chromatogram("A", "B") for _ in range(4)]
+    paths = output_paths(chroms, tmp_path, "png")
+    assert len(set(paths)) == len(chroms)
+    assert [path.name for path in paths] == ["B_A_0.png", "B_A_1.png", "B_A_2.png", "B_A_3.png"]
+
+def test_output_paths_sanitizes_file_names(tmp_path):
+    chroms = [make_chromatogram("x/y z"), make_chromatogram(), make_chromatogram("../..")]
+    paths = output_paths(chroms, tmp_path, "png")
+    assert [path.name for path in paths] == ["x_y_z_0.png", "chromatogram_1.png", ".._.._2.png"]
+    assert all(path.parent == tmp_path for path in paths)